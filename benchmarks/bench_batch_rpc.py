@@ -0,0 +1,91 @@
+# Consultas por lotes contra fake_supabase.py: cuenta las llamadas RPC de una
+# carga en frío de cada pestaña con lote, sin lote, y contra un backend sin
+# ejecutar_sql_lote (un intento fallido y luego consultas individuales).
+# Termina con error si los conteos o los resultados no coinciden.
+#   python benchmarks/bench_batch_rpc.py --scale 0.2 --latency-ms 20
+import argparse
+import json
+import os
+import sys
+import urllib.request
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from bench_load import ROOT, start_backend  # noqa: E402
+
+def backend_calls(url):
+    with urllib.request.urlopen(f'{url}/stats') as response:
+        return json.load(response)['calls']
+
+def cold_load(app, url, batch):
+    # Una carga de todas las pestañas con el cache vacío; devuelve los
+    # resultados por fuente y las llamadas que recibió el backend
+    app.create_app({'SUPABASE_URL': url, 'SNAPSHOT_STORE_ENABLED': False, 'BATCH_RPC_ENABLED': batch})
+    app._batch_rpc_supported = True
+    ctx = app.DateContext.now()
+    before = backend_calls(url)
+    frames, incremental = {}, 0
+    for tab in app.TABS.values():
+        sources = {source: app.FIGURE_SOURCES[source](ctx) for spec in app.tab_figures(tab) for source in spec.deps}
+        incremental += sum(isinstance(query, app.IncrementalAggregate) for query in sources.values())
+        frames.update(app.fetch_tables(sources, ctx=ctx))
+    calls = {function: count - before.get(function, 0) for function, count in backend_calls(url).items()}
+    return frames, {function: count for function, count in calls.items() if count}, incremental
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--scale', type=float, default=0.2)
+    parser.add_argument('--seed', type=int, default=7)
+    parser.add_argument('--latency-ms', type=float, default=20)
+    args = parser.parse_args()
+    args.orders_per_minute, args.error_rate = 0, 0.0
+
+    backends = []
+    try:
+        backend, url = start_backend(args)
+        backends.append(backend)
+        args.without_batch = True
+        backend, url_without_batch = start_backend(args)
+        backends.append(backend)
+        sys.path.insert(0, ROOT)
+        import appMonitoreo
+
+        runs = {
+            'con lote': cold_load(appMonitoreo, url, batch=True),
+            'sin lote': cold_load(appMonitoreo, url, batch=False),
+            'backend sin lote': cold_load(appMonitoreo, url_without_batch, batch=True),
+        }
+        for label, (_, calls, _) in runs.items():
+            print(f"{label:>17}: {sum(calls.values()):>3} llamadas {calls}")
+
+        tabs = len(appMonitoreo.TABS)
+        reference, single, incremental = runs['sin lote']
+        plain = sum(single.values()) - incremental
+        failures = []
+
+        def check(condition, message):
+            print(f"  {'ok' if condition else 'FALLA'}: {message}")
+            if not condition:
+                failures.append(message)
+
+        check(single.get('ejecutar_sql_lote', 0) == 0, "sin lote no se llama a ejecutar_sql_lote")
+        _, calls, _ = runs['con lote']
+        check(calls.get('ejecutar_sql_lote') == tabs, f"con lote: un ejecutar_sql_lote por pestaña ({tabs})")
+        check(calls.get('ejecutar_sql') == incremental,
+              f"con lote: solo los {incremental} agregados incrementales van aparte (antes {plain} consultas simples)")
+        _, calls, _ = runs['backend sin lote']
+        check(calls.get('ejecutar_sql_lote') == 1, "backend sin lote: un único intento fallido")
+        check(calls.get('ejecutar_sql') == sum(single.values()), "backend sin lote: vuelve a consultas individuales")
+        for label in ('con lote', 'backend sin lote'):
+            frames = runs[label][0]
+            check(all(frames[name].reset_index(drop=True).equals(reference[name].reset_index(drop=True))
+                      for name in reference), f"{label}: mismos resultados que sin lote")
+        if failures:
+            sys.exit(f"{len(failures)} comprobaciones fallaron")
+    finally:
+        for backend in backends:
+            backend.terminate()
+            backend.wait()
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,80 @@
+# Estampida de consultas: N hilos piden a la vez las fuentes de una pestaña con
+# el cache vacío, como los callbacks de varias sesiones cuando vence el TTL.
+# Cada hilo pide un subconjunto distinto (fuentes solapadas) y se cuenta
+# cuántas consultas ejecuta el backend por clave; lo esperado es una.
+#   python benchmarks/bench_coalescing.py --threads 50 --rounds 5 --latency-ms 100
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import threading
+import time
+import urllib.request
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from bench_load import ROOT, start_backend  # noqa: E402
+
+def backend_queries(url):
+    with urllib.request.urlopen(f'{url}/stats') as response:
+        return json.load(response)['queries']
+
+def run_round(app, tab, threads, seed):
+    ctx = app.DateContext.now()
+    sources = {source: app.FIGURE_SOURCES[source](ctx) for spec in app.tab_figures(tab) for source in spec.deps}
+    keys = {getattr(query, 'cache_key', None) or app.cache_key(query) for query in sources.values()}
+    rng = random.Random(seed)
+    subsets = [rng.sample(list(sources), rng.randint(1, len(sources))) for _ in range(threads)]
+    barrier = threading.Barrier(threads)
+    latencies = []
+
+    def work(subset):
+        barrier.wait()
+        started = time.perf_counter()
+        app.fetch_tables({source: sources[source] for source in subset}, ctx=ctx)
+        latencies.append(time.perf_counter() - started)
+
+    workers = [threading.Thread(target=work, args=(subset,)) for subset in subsets]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    return len(keys), latencies
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--threads', type=int, default=50)
+    parser.add_argument('--rounds', type=int, default=5)
+    parser.add_argument('--tab', default='sales')
+    parser.add_argument('--scale', type=float, default=1.0)
+    parser.add_argument('--seed', type=int, default=7)
+    parser.add_argument('--latency-ms', type=float, default=100)
+    args = parser.parse_args()
+    args.orders_per_minute, args.error_rate = 0, 0.0
+
+    backend, url = start_backend(args)
+    try:
+        os.environ['DASHBOARD_SUPABASE_URL'] = url
+        sys.path.insert(0, ROOT)
+        import appMonitoreo
+        appMonitoreo.create_app({'SNAPSHOT_STORE_ENABLED': False})
+
+        print(f"{args.threads} hilos, pestaña {args.tab}")
+        print(f"{'ronda':>5} {'claves':>7} {'consultas':>10} {'por clave':>10} {'p50':>9} {'máx':>9}")
+        for round_number in range(1, args.rounds + 1):
+            appMonitoreo.query_cache.clear()
+            before = backend_queries(url)
+            keys, latencies = run_round(appMonitoreo, args.tab, args.threads, args.seed + round_number)
+            queries = backend_queries(url) - before
+            print(f"{round_number:>5} {keys:>7} {queries:>10} {queries / max(keys, 1):>10.2f} "
+                  f"{statistics.median(latencies) * 1000:>7.0f}ms {max(latencies) * 1000:>7.0f}ms")
+        stats = appMonitoreo.query_cache.stats()
+        print(f"\nEsperas compartidas: {stats['coalesced']}, fallos de cache: {stats['misses']}")
+    finally:
+        backend.terminate()
+        backend.wait()
+
+if __name__ == '__main__':
+    main()
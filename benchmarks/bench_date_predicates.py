@@ -0,0 +1,69 @@
+# Compara EXTRACT(YEAR/MONTH ...) = ... contra rangos semiabiertos sobre una
+# columna indexada, usando SQLite como sustituto local de Postgres.
+#   python benchmarks/bench_date_predicates.py --rows 1000000
+import argparse
+import math
+import random
+import sqlite3
+import time
+from datetime import datetime, timedelta
+
+EXTRACT_SQL = """
+    SELECT COUNT(*), SUM(total) FROM pedidos
+    WHERE CAST(strftime('%Y', fecha) AS INTEGER) = ?
+      AND CAST(strftime('%m', fecha) AS INTEGER) = ?
+"""
+
+RANGE_SQL = """
+    SELECT COUNT(*), SUM(total) FROM pedidos
+    WHERE fecha >= ? AND fecha < ?
+"""
+
+def build_database(rows, years, seed):
+    random.seed(seed)
+    conn = sqlite3.connect(':memory:')
+    conn.execute("CREATE TABLE pedidos (id INTEGER PRIMARY KEY, cliente_id INTEGER, fecha TEXT, total REAL)")
+    start = datetime(2026, 10, 18) - timedelta(days=365 * years)
+    span = int(timedelta(days=365 * years).total_seconds())
+    conn.executemany(
+        "INSERT INTO pedidos (cliente_id, fecha, total) VALUES (?, ?, ?)",
+        (
+            (random.randint(1, rows // 10 + 1),
+             (start + timedelta(seconds=random.randrange(span))).isoformat(sep=' '),
+             round(random.uniform(20, 400), 2))
+            for _ in range(rows)
+        ),
+    )
+    conn.execute("CREATE INDEX pedidos_fecha_idx ON pedidos (fecha)")
+    conn.execute("ANALYZE")
+    return conn
+
+def timed(conn, sql, params, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = conn.execute(sql, params).fetchone()
+        best = min(best, time.perf_counter() - started)
+    plan = ' / '.join(row[-1] for row in conn.execute('EXPLAIN QUERY PLAN ' + sql, params))
+    return best, result, plan
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, default=500_000)
+    parser.add_argument('--years', type=int, default=3)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--seed', type=int, default=7)
+    args = parser.parse_args()
+
+    conn = build_database(args.rows, args.years, args.seed)
+    extract_time, extract_result, extract_plan = timed(conn, EXTRACT_SQL, (2026, 10), args.repeat)
+    range_time, range_result, range_plan = timed(conn, RANGE_SQL, ('2026-10-01', '2026-11-01'), args.repeat)
+    assert extract_result[0] == range_result[0] and math.isclose(extract_result[1], range_result[1]), (extract_result, range_result)
+
+    print(f"filas: {args.rows:,}  filas del mes: {extract_result[0]:,}")
+    print(f"EXTRACT      {extract_time * 1000:8.2f} ms  {extract_plan}")
+    print(f"rango [a, b) {range_time * 1000:8.2f} ms  {range_plan}")
+    print(f"speedup      {extract_time / range_time:8.1f}x")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,145 @@
+# Memoria máxima al decodificar una respuesta grande de ejecutar_sql:
+# json.loads + DataFrame(lista de dicts) contra la decodificación en streaming
+# de appMonitoreo (iter_json_rows + ColumnBuffers con dtypes declarados).
+# Cada modo corre en su propio proceso para que el RSS máximo sea comparable.
+# Antes comprueba que el streaming no trunque ni falle cuando los valores no
+# caben en el tipo de la columna (termina con error si no).
+#   python benchmarks/bench_decode.py --rows 500000
+import argparse
+import json
+import os
+import random
+import resource
+import subprocess
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+CHUNK_SIZE = 64 * 1024
+TALLAS = ['XS', 'S', 'M', 'L', 'XL']
+COLORES = ['negro', 'blanco', 'rojo', 'nude', 'rosa', 'azul']
+
+def generate_rows(rows, seed):
+    rng = random.Random(seed)
+    for i in range(rows):
+        yield {
+            'variante_id': i,
+            'nombre_producto': f'Producto {rng.randrange(rows // 20 + 1)}',
+            'talla': rng.choice(TALLAS),
+            'color': rng.choice(COLORES),
+            'stock_actual': rng.randrange(500),
+            'total_filas': rows,
+        }
+
+def generate_body(rows, seed):
+    # Igual que PostgREST: [{"data": [fila, ...]}], entregado en trozos
+    pending = '[{"data": ['
+    for i, row in enumerate(generate_rows(rows, seed)):
+        pending += (', ' if i else '') + json.dumps(row, ensure_ascii=False)
+        if len(pending) >= CHUNK_SIZE:
+            yield pending
+            pending = ''
+    yield pending + ']}]'
+
+def decode_list(rows, seed):
+    import pandas as pd
+    body = ''.join(generate_body(rows, seed))
+    data = json.loads(body)[0]['data']
+    return pd.DataFrame(data)
+
+def decode_stream(rows, seed):
+    from appMonitoreo import ColumnBuffers, iter_json_rows
+    buffers = ColumnBuffers()
+    for row in iter_json_rows(generate_body(rows, seed)):
+        buffers.append(row)
+    return buffers.to_frame()
+
+MODES = {'lista': decode_list, 'streaming': decode_stream}
+
+# Filas cuyo valor no cabe en el tipo declarado (stock_actual es int32) o
+# inferido del primer valor (extra empieza como número)
+WIDENING_CASES = {
+    'int32 fuera de rango': [{'stock_actual': 5}, {'stock_actual': 2**31 + 7}, {'stock_actual': None}],
+    'int32 con decimales': [{'stock_actual': 5}, {'stock_actual': 2.5}],
+    'número y luego texto': [{'extra': 1.5}, {'extra': 'sin dato'}, {'extra': None}],
+}
+
+def check_widening():
+    import pandas as pd
+    from appMonitoreo import ColumnBuffers
+    failures = []
+    for label, rows in WIDENING_CASES.items():
+        name = next(iter(rows[0]))
+        expected = [row[name] for row in rows]
+        buffers = ColumnBuffers()
+        try:
+            for row in rows:
+                buffers.append(row)
+            column = buffers.to_frame()[name]
+            values = [None if pd.isna(value) else value for value in column.astype(object)]
+            ok = values == expected
+            result = f"{column.dtype}: {values}"
+        except Exception as exc:
+            ok, result = False, repr(exc)
+        print(f"  {'ok' if ok else 'FALLA'}: {label} -> {result}")
+        if not ok:
+            failures.append(label)
+    return failures
+
+def run_mode(mode, rows, seed):
+    # Importa antes de medir para no contar pandas/Dash en la memoria de la consulta
+    import pandas  # noqa: F401
+    if mode == 'streaming':
+        import appMonitoreo  # noqa: F401
+    baseline_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    tracemalloc.start()
+    df = MODES[mode](rows, seed)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    rss_growth = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - baseline_rss
+    # El tiempo se mide en otra pasada: tracemalloc ralentiza cada asignación
+    del df
+    started = time.perf_counter()
+    df = MODES[mode](rows, seed)
+    elapsed = time.perf_counter() - started
+    print(json.dumps({
+        'mode': mode,
+        'rows': len(df),
+        'seconds': round(elapsed, 3),
+        'traced_peak_mb': round(peak / 2**20, 1),
+        'rss_growth_mb': round(rss_growth / 1024, 1),
+        'frame_mb': round(df.memory_usage(deep=True).sum() / 2**20, 1),
+        'object_columns': [name for name, dtype in df.dtypes.items() if dtype == object],
+    }))
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, default=200_000)
+    parser.add_argument('--seed', type=int, default=7)
+    parser.add_argument('--mode', choices=sorted(MODES))
+    args = parser.parse_args()
+
+    if args.mode:
+        run_mode(args.mode, args.rows, args.seed)
+        return
+
+    print("Tipos que no alcanzan")
+    failures = check_widening()
+    if failures:
+        sys.exit(f"{len(failures)} comprobaciones fallaron")
+
+    print(f"\n{args.rows} filas")
+    print(f"{'modo':<10} {'tiempo':>8} {'pico traza':>11} {'RSS +':>9} {'DataFrame':>10}  columnas object")
+    for mode in MODES:
+        output = subprocess.run(
+            [sys.executable, __file__, '--mode', mode, '--rows', str(args.rows), '--seed', str(args.seed)],
+            check=True, capture_output=True, text=True,
+        ).stdout.strip().splitlines()[-1]
+        result = json.loads(output)
+        print(f"{mode:<10} {result['seconds']:>7.2f}s {result['traced_peak_mb']:>8.1f} MB "
+              f"{result['rss_growth_mb']:>6.1f} MB {result['frame_mb']:>7.1f} MB  {result['object_columns'] or '-'}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,111 @@
+# Lectura concurrente de una pestaña: con un transporte falso que demora cada
+# consulta, fetch_tables en frío debe tardar cerca de la consulta más lenta y
+# no la suma. También comprueba que una consulta que falla o que no responde
+# dentro del plazo no retiene a las demás. Termina con error si algo no se cumple.
+#   python benchmarks/bench_fetch_concurrency.py --min-ms 50 --max-ms 250
+import argparse
+import os
+import random
+import sys
+import threading
+import time
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from bench_load import ROOT  # noqa: E402
+
+def call_key(function, payload):
+    return function, repr(sorted(payload.items()))
+
+class DelayedTransport:
+    # Sustituye a RpcTransport: cada llamada duerme su demora y devuelve un
+    # resultado vacío. Las de `failing` fallan y las de `hung` tardan `hang` segundos.
+    def __init__(self, rng, min_delay, max_delay, error, failing=(), hung=(), hang=0):
+        self.rng = rng
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.error = error
+        self.failing = set(failing)
+        self.hung = set(hung)
+        self.hang = hang
+        self.delays = {}
+        self._lock = threading.Lock()
+
+    def call(self, function, payload, read=None):
+        key = call_key(function, payload)
+        if key in self.hung:
+            time.sleep(self.hang)
+        else:
+            with self._lock:
+                delay = self.delays.setdefault(key, self.rng.uniform(self.min_delay, self.max_delay))
+            time.sleep(delay)
+        if key in self.failing:
+            raise self.error(f"{function}: fallo simulado")
+        return pd.DataFrame() if read is not None else [{'data': []}]
+
+def cold_fetch(app, sources, ctx, **kwargs):
+    app.query_cache.clear()
+    started = time.perf_counter()
+    frames = app.fetch_tables(sources, ctx=ctx, **kwargs)
+    return frames, time.perf_counter() - started
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--min-ms', type=float, default=50)
+    parser.add_argument('--max-ms', type=float, default=250)
+    parser.add_argument('--seed', type=int, default=7)
+    parser.add_argument('--slack-ms', type=float, default=100, help='margen sobre la consulta más lenta')
+    args = parser.parse_args()
+
+    os.environ.setdefault('DASHBOARD_SUPABASE_URL', 'http://127.0.0.1:9')
+    sys.path.insert(0, ROOT)
+    import appMonitoreo
+    # Sin lote: cada consulta es su propia llamada, que es lo que se paraleliza
+    appMonitoreo.create_app({'SNAPSHOT_STORE_ENABLED': False, 'BATCH_RPC_ENABLED': False})
+    ctx = appMonitoreo.DateContext.now()
+    rng = random.Random(args.seed)
+    delays = (args.min_ms / 1000, args.max_ms / 1000)
+    slack = args.slack_ms / 1000
+    failures = []
+
+    def check(condition, message):
+        print(f"  {'ok' if condition else 'FALLA'}: {message}")
+        if not condition:
+            failures.append(message)
+
+    for tab in appMonitoreo.TABS.values():
+        sources = {source: appMonitoreo.FIGURE_SOURCES[source](ctx)
+                   for spec in appMonitoreo.tab_figures(tab) for source in spec.deps}
+        transport = appMonitoreo.transport = DelayedTransport(rng, *delays, appMonitoreo.RpcError)
+        frames, elapsed = cold_fetch(appMonitoreo, sources, ctx)
+        slowest, total = max(transport.delays.values()), sum(transport.delays.values())
+        print(f"{tab}: {len(transport.delays)} consultas, la más lenta {slowest * 1000:.0f}ms, "
+              f"suma {total * 1000:.0f}ms, fetch_tables {elapsed * 1000:.0f}ms")
+        check(set(frames) == set(sources), "un resultado por fuente")
+        check(elapsed < slowest + slack, f"tarda menos que la más lenta + {args.slack_ms:.0f}ms")
+
+        # Una consulta simple (no incremental) que falla o se cuelga
+        name, query = next((name, query) for name, query in sources.items()
+                           if not isinstance(query, appMonitoreo.IncrementalAggregate))
+        key = call_key(*appMonitoreo.rpc_target(query))
+        transport = appMonitoreo.transport = DelayedTransport(rng, *delays, appMonitoreo.RpcError, failing=[key])
+        frames, elapsed = cold_fetch(appMonitoreo, sources, ctx)
+        check(set(frames) == set(sources) and frames[name].empty, f"si falla {name} llegan las demás")
+        check(elapsed < max(transport.delays.values()) + slack, "la falla no alarga la espera")
+
+        timeout = args.max_ms / 1000 + slack
+        hang = timeout * 3
+        appMonitoreo.transport = DelayedTransport(rng, *delays, appMonitoreo.RpcError, hung=[key], hang=hang)
+        frames, elapsed = cold_fetch(appMonitoreo, sources, ctx, timeout=timeout)
+        check(set(frames) == set(sources), f"si {name} no responde se devuelve lo demás")
+        check(elapsed < timeout + slack, f"respeta el plazo de {timeout * 1000:.0f}ms")
+        # La llamada colgada sigue ocupando un hilo del pool hasta terminar
+        time.sleep(hang)
+
+    if failures:
+        sys.exit(f"{len(failures)} comprobaciones fallaron")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,339 @@
+# Prueba de carga del panel contra el Supabase falso de fake_supabase.py.
+# Levanta el backend y appMonitoreo en procesos propios y simula N navegadores
+# que abren una pestaña y sondean /dashboard/_dash-update-component como lo
+# haría dcc.Interval (con el mismo retroceso cuando no hay cambios). Si el
+# panel anuncia /dashboard/events, cada cliente se suscribe como EventSource y
+# solo sincroniza al recibir un aviso; si el flujo se rechaza, sondea.
+# Reporta percentiles de latencia por callback, peticiones por segundo,
+# bytes por tick y la memoria residente del servidor.
+#   python benchmarks/bench_load.py --clients 50 --duration 60 --scale 5
+#   python benchmarks/bench_load.py --env DASHBOARD_CLIENTSIDE_REFRESH=0
+#   python benchmarks/bench_load.py --server gunicorn --workers 2 --threads 8
+import argparse
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from collections import defaultdict
+
+import httpx
+import numpy as np
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+FAKE_SUPABASE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fake_supabase.py')
+UPDATE_PATH = '/dashboard/_dash-update-component'
+
+def start_backend(args):
+    process = subprocess.Popen(
+        [sys.executable, FAKE_SUPABASE, '--port', '0', '--scale', str(args.scale), '--seed', str(args.seed),
+         '--latency-ms', str(args.latency_ms), '--orders-per-minute', str(args.orders_per_minute),
+         '--error-rate', str(args.error_rate)] + (['--without-batch'] if getattr(args, 'without_batch', False) else []),
+        stdout=subprocess.PIPE, text=True,
+    )
+    line = process.stdout.readline()
+    if not line.startswith('escuchando en '):
+        process.kill()
+        raise RuntimeError("fake_supabase.py no arrancó")
+    return process, line.split()[-1]
+
+def start_app(args, backend_url, directory):
+    env = dict(os.environ, DASHBOARD_SUPABASE_URL=backend_url,
+               DASHBOARD_CACHE_DIR=os.path.join(directory, 'cache'),
+               DASHBOARD_SNAPSHOT_DIR=os.path.join(directory, 'snapshots'))
+    env.update(item.split('=', 1) for item in args.env)
+    if args.server == 'gunicorn':
+        command = [sys.executable, '-m', 'gunicorn', 'appMonitoreo:create_app()', '--bind', f'127.0.0.1:{args.port}',
+                   '--workers', str(args.workers), '--threads', str(args.threads), '--log-level', 'warning']
+    else:
+        command = [sys.executable, '-c',
+                   "import sys, appMonitoreo; appMonitoreo.create_app().run(host='127.0.0.1', port=int(sys.argv[1]), threaded=True)",
+                   str(args.port)]
+    process = subprocess.Popen(command, cwd=ROOT, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    base_url = f'http://127.0.0.1:{args.port}'
+    deadline = time.monotonic() + 120
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError("appMonitoreo terminó al arrancar")
+        try:
+            if httpx.get(f'{base_url}/dashboard/', timeout=1).status_code == 200:
+                return process, base_url
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.2)
+    process.kill()
+    raise RuntimeError("appMonitoreo no respondió a tiempo")
+
+def process_tree(pid):
+    pids, pending = [], [pid]
+    while pending:
+        current = pending.pop()
+        pids.append(current)
+        try:
+            with open(f'/proc/{current}/task/{current}/children') as f:
+                pending.extend(int(child) for child in f.read().split())
+        except OSError:
+            pass
+    return pids
+
+def rss_mb(pid):
+    # Suma el RSS del proceso y sus hijos (los workers de gunicorn); solo Linux
+    total = 0
+    for current in process_tree(pid):
+        try:
+            with open(f'/proc/{current}/status') as f:
+                total += next(int(line.split()[1]) for line in f if line.startswith('VmRSS:'))
+        except (OSError, StopIteration):
+            pass
+    return total / 1024 if total else None
+
+def find_component(node, component_id):
+    if isinstance(node, dict):
+        if node.get('props', {}).get('id') == component_id:
+            return node
+        return find_component(node.get('props', {}).get('children'), component_id)
+    if isinstance(node, list):
+        for child in node:
+            found = find_component(child, component_id)
+            if found is not None:
+                return found
+    return None
+
+def split_outputs(output):
+    # '..a.b...c.d..' para callbacks con varias salidas
+    if output.startswith('..'):
+        return [{'id': part.rsplit('.', 1)[0], 'property': part.rsplit('.', 1)[1]} for part in output[2:-2].split('...')], True
+    return [{'id': output.rsplit('.', 1)[0], 'property': output.rsplit('.', 1)[1]}], False
+
+class DashProtocol:
+    def __init__(self, client):
+        dependencies = client.get('/dashboard/_dash-dependencies').json()
+        layout = client.get('/dashboard/_dash-layout').json()
+        self.render = next(d for d in dependencies if 'tabs-content-main.children' in d['output'])
+        self.delta = next((d for d in dependencies if d['output'] == 'figure-delta.data'), None)
+        poll_config = find_component(layout, 'poll-config')
+        self.poll_config = poll_config['props']['data'] if poll_config else None
+        self.events = (self.poll_config or {}).get('events')
+
+    def payload(self, dependency, values, changed):
+        outputs, multiple = split_outputs(dependency['output'])
+        return {
+            'output': dependency['output'],
+            'outputs': outputs if multiple else outputs[0],
+            'inputs': [dict(item, value=values.get(f"{item['id']}.{item['property']}")) for item in dependency['inputs']],
+            'state': [dict(item, value=values.get(f"{item['id']}.{item['property']}")) for item in dependency['state']],
+            'changedPropIds': changed,
+        }
+
+class SimulatedClient(threading.Thread):
+    def __init__(self, base_url, protocol, tab, args, results, deadline):
+        super().__init__(daemon=True)
+        self.client = httpx.Client(base_url=base_url, timeout=60)
+        self.protocol = protocol
+        self.tab = tab
+        self.args = args
+        self.results = results
+        self.deadline = deadline
+        self.version = None
+        self.n_intervals = 0
+        self.push_event = None
+
+    def values(self):
+        return {'tabs-main.value': self.tab, 'rendered-version.data': self.version,
+                'interval-component.n_intervals': self.n_intervals, 'push-event.data': self.push_event}
+
+    def post(self, dependency, changed):
+        started = time.perf_counter()
+        try:
+            response = self.client.post(UPDATE_PATH, json=self.protocol.payload(dependency, self.values(), changed))
+        except httpx.HTTPError:
+            return None, time.perf_counter() - started, 0, False
+        elapsed = time.perf_counter() - started
+        body = response.json()['response'] if response.status_code == 200 else {}
+        return body, elapsed, len(response.content), response.status_code in (200, 204)
+
+    def base_interval(self):
+        if self.args.poll:
+            return self.args.poll
+        config = self.protocol.poll_config or {}
+        return config.get('base', {}).get(self.tab, config.get('fallback', 5))
+
+    def next_interval(self, interval, changed):
+        # Igual que SCHEDULE_POLLING_JS: vuelve a la base al recibir cambios y
+        # se alarga mientras no los hay
+        config = self.protocol.poll_config
+        if self.args.poll or not config or changed:
+            return self.base_interval()
+        return min(interval * config['factor'], max(config['max'], self.base_interval()))
+
+    def tick(self, trigger='interval-component.n_intervals', kind='tick'):
+        if self.protocol.delta is not None:
+            response, *sample = self.post(self.protocol.delta, [trigger])
+            delta = (response or {}).get('figure-delta', {}).get('data')
+            if delta:
+                # Lo que APPLY_FIGURE_DELTA_JS hace con rendered-version
+                figures = dict((self.version or {}).get('figures') or {}, **delta['versions'])
+                self.version = {'tab': delta['tab'], 'fingerprint': delta['fingerprint'], 'figures': figures}
+        else:
+            response, *sample = self.post(self.protocol.render, [trigger])
+            delta = (response or {}).get('rendered-version', {}).get('data')
+            if delta:
+                self.version = delta
+        self.results.record(kind, *sample, bool(delta))
+        return bool(delta)
+
+    def listen(self):
+        # Lo que hace SUBSCRIBE_EVENTS_JS; devuelve False si el servidor rechaza
+        # el flujo (sin flujos libres) para seguir sondeando
+        last_event = None
+        while time.monotonic() < self.deadline:
+            headers = {'Last-Event-ID': last_event} if last_event else {}
+            try:
+                with self.client.stream('GET', self.protocol.events, params={'tab': self.tab},
+                                        headers=headers, timeout=httpx.Timeout(10, read=None)) as response:
+                    if response.status_code != 200:
+                        return False
+                    # La lectura solo vuelve con un aviso o un latido, así que un
+                    # cliente puede terminar hasta PUSH_HEARTBEAT_SECONDS después del plazo
+                    for line in response.iter_lines():
+                        if time.monotonic() >= self.deadline:
+                            break
+                        if line.startswith('id: '):
+                            last_event = line[len('id: '):]
+                        elif line.startswith('data: '):
+                            self.push_event = json.loads(line[len('data: '):])
+                            self.tick('push-event.data', 'push')
+            except httpx.HTTPError:
+                time.sleep(1)
+        return True
+
+    def run(self):
+        time.sleep(random.uniform(0, self.args.ramp_up))
+        response, *sample = self.post(self.protocol.render, ['tabs-main.value'])
+        if response:
+            self.version = response['rendered-version']['data']
+        self.results.record('render', *sample, bool(response))
+        if self.protocol.events and not self.args.poll and self.listen():
+            self.client.close()
+            return
+        interval = self.base_interval()
+        while True:
+            wake = time.monotonic() + interval
+            if wake >= self.deadline:
+                break
+            time.sleep(wake - time.monotonic())
+            self.n_intervals += 1
+            interval = self.next_interval(interval, self.tick())
+        self.client.close()
+
+class Results:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.samples = defaultdict(list)
+
+    def record(self, kind, seconds, size, ok, changed):
+        with self.lock:
+            self.samples[kind].append((seconds, size, ok, changed))
+
+    def report(self, elapsed):
+        rows = {}
+        for kind, samples in sorted(self.samples.items()):
+            seconds = np.array([s[0] for s in samples])
+            sizes = np.array([s[1] for s in samples])
+            rows[kind] = {
+                'requests': len(samples),
+                'per_second': round(len(samples) / elapsed, 2),
+                'errors': sum(1 for s in samples if not s[2]),
+                'with_changes': sum(1 for s in samples if s[3]),
+                'p50_ms': round(float(np.percentile(seconds, 50)) * 1000, 1),
+                'p95_ms': round(float(np.percentile(seconds, 95)) * 1000, 1),
+                'p99_ms': round(float(np.percentile(seconds, 99)) * 1000, 1),
+                'max_ms': round(float(seconds.max()) * 1000, 1),
+                'bytes_mean': int(sizes.mean()),
+                'bytes_p95': int(np.percentile(sizes, 95)),
+                'bytes_total': int(sizes.sum()),
+            }
+        return rows
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--clients', type=int, default=20)
+    parser.add_argument('--duration', type=float, default=60, help='segundos de medición')
+    parser.add_argument('--ramp-up', type=float, default=5, help='los clientes abren la pestaña escalonados en este lapso')
+    parser.add_argument('--tabs', nargs='+', default=['tab-sales', 'tab-inventory'])
+    parser.add_argument('--poll', type=float, help='intervalo fijo en segundos en vez de poll-config del panel')
+    parser.add_argument('--scale', type=float, default=1.0)
+    parser.add_argument('--seed', type=int, default=7)
+    parser.add_argument('--latency-ms', type=float, default=20)
+    parser.add_argument('--orders-per-minute', type=float, default=30)
+    parser.add_argument('--error-rate', type=float, default=0.0, help='fracción de llamadas al backend que fallan')
+    parser.add_argument('--server', choices=['werkzeug', 'gunicorn'], default='werkzeug')
+    parser.add_argument('--workers', type=int, default=2)
+    parser.add_argument('--threads', type=int, default=8)
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--env', action='append', default=[], metavar='NOMBRE=VALOR',
+                        help='variable de entorno para appMonitoreo (repetible)')
+    parser.add_argument('--json', action='store_true', help='imprime el resultado como JSON')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix='bench-load-') as directory:
+        backend, backend_url = start_backend(args)
+        app = None
+        try:
+            app, base_url = start_app(args, backend_url, directory)
+            with httpx.Client(base_url=base_url, timeout=60) as client:
+                protocol = DashProtocol(client)
+            backend_before = httpx.get(f'{backend_url}/stats').json()
+
+            results = Results()
+            memory = []
+            started = time.monotonic()
+            deadline = started + args.ramp_up + args.duration
+            clients = [SimulatedClient(base_url, protocol, args.tabs[i % len(args.tabs)], args, results, deadline)
+                       for i in range(args.clients)]
+            for client in clients:
+                client.start()
+            while any(client.is_alive() for client in clients):
+                memory.append(rss_mb(app.pid))
+                time.sleep(0.5)
+            elapsed = min(time.monotonic(), deadline) - started
+
+            backend_after = httpx.get(f'{backend_url}/stats').json()
+        finally:
+            for process in (app, backend):
+                if process is not None:
+                    process.terminate()
+                    process.wait()
+
+    memory = [value for value in memory if value is not None]
+    summary = {
+        'clients': args.clients,
+        'seconds': round(elapsed, 1),
+        'mode': ('deltas' if protocol.delta is not None else 'render completo')
+                + (', avisos SSE' if protocol.events and not args.poll else ''),
+        'callbacks': results.report(elapsed),
+        'rss_mb_peak': round(max(memory), 1) if memory else None,
+        'rss_mb_end': round(memory[-1], 1) if memory else None,
+        'backend_calls': sum(backend_after['calls'].values()) - sum(backend_before['calls'].values()),
+        'backend_rows': backend_after['rows'] - backend_before['rows'],
+        'backend_query_seconds': round(backend_after['query_seconds'] - backend_before['query_seconds'], 3),
+    }
+    if args.json:
+        print(json.dumps(summary, ensure_ascii=False))
+        return
+
+    print(f"{summary['clients']} clientes durante {summary['seconds']}s ({summary['mode']})")
+    print(f"{'callback':<8} {'pet.':>6} {'pet/s':>7} {'err':>4} {'cambios':>8} {'p50':>8} {'p95':>8} {'p99':>8} {'máx':>8} {'bytes/pet':>10} {'p95 bytes':>10}")
+    for kind, row in summary['callbacks'].items():
+        print(f"{kind:<8} {row['requests']:>6} {row['per_second']:>7.2f} {row['errors']:>4} {row['with_changes']:>8} "
+              f"{row['p50_ms']:>6.1f}ms {row['p95_ms']:>6.1f}ms {row['p99_ms']:>6.1f}ms {row['max_ms']:>6.1f}ms "
+              f"{row['bytes_mean']:>10,} {row['bytes_p95']:>10,}")
+    print(f"RSS del servidor: pico {summary['rss_mb_peak']} MB, final {summary['rss_mb_end']} MB")
+    print(f"Backend: {summary['backend_calls']} llamadas, {summary['backend_rows']:,} filas, "
+          f"{summary['backend_query_seconds']}s en consultas")
+
+if __name__ == '__main__':
+    main()
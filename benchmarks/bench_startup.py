@@ -0,0 +1,144 @@
+# Costo de arranque: importar appMonitoreo, crear la app y levantar workers
+# de gunicorn con y sin preload (gunicorn.conf.py).
+# Cada medición corre en un proceso nuevo para que no haya módulos en caché.
+# Al final comprueba que N primeros render simultáneos, recién arrancado el
+# servidor, respondan todos 200 (termina con error si alguno falla).
+#   python benchmarks/bench_startup.py --workers 4 --repeat 5 --concurrent 8
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+import httpx
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from bench_load import ROOT, UPDATE_PATH, DashProtocol, process_tree, start_app, start_backend  # noqa: E402
+
+STEPS = {
+    'import': "import appMonitoreo",
+    'create_app()': "import appMonitoreo; appMonitoreo.create_app()",
+}
+
+MEASURE = """
+import json, resource, sys, time
+started = time.perf_counter()
+{step}
+elapsed = time.perf_counter() - started
+print(json.dumps({{'seconds': elapsed, 'modules': len(sys.modules),
+                  'rss_mb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024}}))
+"""
+
+READY = re.compile(r'listo en ([\d.]+)s')
+
+def pss_mb(pid):
+    # PSS reparte las páginas compartidas entre procesos: con preload los
+    # workers comparten lo que cargó el maestro y el RSS lo contaría N veces
+    total = 0
+    for current in process_tree(pid):
+        try:
+            with open(f'/proc/{current}/smaps_rollup') as f:
+                total += next(int(line.split()[1]) for line in f if line.startswith('Pss:'))
+        except (OSError, StopIteration):
+            pass
+    return total / 1024 if total else None
+
+def measure_step(step, repeat):
+    runs = [
+        json.loads(subprocess.run([sys.executable, '-c', MEASURE.format(step=step)], cwd=ROOT,
+                                  check=True, capture_output=True, text=True).stdout.strip().splitlines()[-1])
+        for _ in range(repeat)
+    ]
+    return min(run['seconds'] for run in runs), runs[-1]['modules'], runs[-1]['rss_mb']
+
+def measure_gunicorn(preload, workers, port):
+    env = dict(os.environ, DASHBOARD_PRELOAD='1' if preload else '0', DASHBOARD_WORKERS=str(workers),
+               DASHBOARD_BIND=f'127.0.0.1:{port}')
+    started = time.monotonic()
+    process = subprocess.Popen([sys.executable, '-m', 'gunicorn', '-c', 'gunicorn.conf.py'], cwd=ROOT, env=env,
+                               stderr=subprocess.PIPE, text=True)
+    ready = []
+    try:
+        for line in process.stderr:
+            match = READY.search(line)
+            if match:
+                ready.append(float(match.group(1)))
+                if len(ready) == workers:
+                    break
+        total = time.monotonic() - started
+        memory = pss_mb(process.pid)
+    finally:
+        process.terminate()
+        process.wait()
+    return statistics.median(ready), max(ready), total, memory
+
+def first_renders(concurrent, port):
+    # Los primeros callbacks llegan a la vez que los hilos de refresco: ninguno
+    # debe ver un módulo a medio importar
+    backend_args = argparse.Namespace(scale=0.2, seed=7, latency_ms=20, orders_per_minute=0, error_rate=0.0)
+    app_args = argparse.Namespace(server='werkzeug', port=port, env=[])
+    with tempfile.TemporaryDirectory(prefix='bench-startup-') as directory:
+        backend, backend_url = start_backend(backend_args)
+        app = None
+        try:
+            app, base_url = start_app(app_args, backend_url, directory)
+            with httpx.Client(base_url=base_url, timeout=60) as client:
+                protocol = DashProtocol(client)
+            barrier = threading.Barrier(concurrent)
+            statuses = []
+
+            def render(tab):
+                payload = protocol.payload(protocol.render, {'tabs-main.value': tab}, ['tabs-main.value'])
+                with httpx.Client(base_url=base_url, timeout=60) as client:
+                    barrier.wait()
+                    statuses.append(client.post(UPDATE_PATH, json=payload).status_code)
+
+            threads = [threading.Thread(target=render, args=(('tab-sales', 'tab-inventory')[i % 2],))
+                       for i in range(concurrent)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            for process in (app, backend):
+                if process is not None:
+                    process.terminate()
+                    process.wait()
+    return statuses
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--workers', type=int, default=4)
+    parser.add_argument('--port', type=int, default=8766)
+    parser.add_argument('--concurrent', type=int, default=8, help='render simultáneos recién arrancado')
+    parser.add_argument('--only-first-renders', action='store_true', help='omite las mediciones de tiempo y memoria')
+    args = parser.parse_args()
+
+    if not args.only_first_renders:
+        print(f"{'paso':<26} {'tiempo':>8} {'módulos':>8} {'RSS':>9}")
+        for label, step in STEPS.items():
+            seconds, modules, memory = measure_step(step, args.repeat)
+            print(f"{label:<26} {seconds:>7.3f}s {modules:>8} {memory:>6.1f} MB")
+
+        print(f"\ngunicorn, {args.workers} workers")
+        print(f"{'modo':<10} {'worker (mediana)':>17} {'worker (máx)':>13} {'todos listos':>13} {'PSS total':>10}")
+        for preload in (False, True):
+            median, slowest, total, memory = measure_gunicorn(preload, args.workers, args.port)
+            print(f"{'preload' if preload else 'por worker':<10} {median:>16.3f}s {slowest:>12.3f}s {total:>12.3f}s "
+                  f"{memory or 0:>7.1f} MB")
+
+    statuses = first_renders(args.concurrent, args.port + 1)
+    failed = [status for status in statuses if status != 200]
+    print(f"\n{args.concurrent} primeros render simultáneos: {statuses.count(200)} con 200, fallidos: {failed or 'ninguno'}")
+    if failed or len(statuses) != args.concurrent:
+        sys.exit("algún render inicial falló")
+
+if __name__ == '__main__':
+    main()
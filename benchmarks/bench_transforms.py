@@ -0,0 +1,102 @@
+# Transformaciones del panel de inventario: versión anterior fila a fila
+# (apply, unique() por fila, iterrows) contra las funciones vectorizadas de
+# appMonitoreo (with_period_labels, build_stock_cards).
+#   python benchmarks/bench_transforms.py --sizes 1000 10000 20000
+import argparse
+import json
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+from plotly.utils import PlotlyJSONEncoder
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from appMonitoreo import build_stock_cards, dash_html, with_period_labels  # noqa: E402
+
+def movimientos_frame(rows, seed):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        'mes': rng.integers(1, 13, rows).astype('int32'),
+        'año': rng.integers(2000, 2027, rows).astype('int32'),
+        'entradas': rng.uniform(0, 500, rows),
+        'salidas': rng.uniform(0, 500, rows),
+    })
+
+def stock_frame(rows, seed):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        'nombre_producto': [f'Producto {i}' for i in range(rows)],
+        'stock_total': rng.integers(0, 5000, rows).astype('float64'),
+    })
+
+def period_labels_por_fila(df):
+    df = df.copy()
+    df['mes_nombre'] = df['mes'].apply(lambda x: pd.to_datetime(f'2000-{int(x)}-01').strftime('%b'))
+    df['periodo_display'] = df.apply(lambda row: f"{row['mes_nombre']} {int(row['año'])}" if len(df['año'].unique()) > 1 else row['mes_nombre'], axis=1)
+    return df
+
+def stock_cards_por_fila(df):
+    cards = []
+    for index, row in df.iterrows():
+        cards.append(
+            dash_html.Div(
+                [
+                    dash_html.H4(row['nombre_producto'], style={'margin-bottom': '5px', 'color': '#2c3e50'}),
+                    dash_html.P(f"Stock Total: {int(row['stock_total'])}", style={'fontSize': '1.2em', 'fontWeight': 'bold', 'color': '#4CAF50'}),
+                ],
+                style={
+                    'backgroundColor': '#ffffff',
+                    'padding': '15px 20px',
+                    'borderRadius': '8px',
+                    'boxShadow': '0 2px 4px rgba(0,0,0,0.05)',
+                    'textAlign': 'center',
+                    'flexBasis': 'calc(33% - 20px)',
+                    'minWidth': '200px',
+                    'maxWidth': '300px',
+                    'margin': '10px 0',
+                    'display': 'flex',
+                    'flexDirection': 'column',
+                    'justifyContent': 'center',
+                    'alignItems': 'center'
+                }
+            )
+        )
+    return cards
+
+CASES = [
+    ('etiquetas de periodo', movimientos_frame, period_labels_por_fila, with_period_labels),
+    ('tarjetas de stock', stock_frame, stock_cards_por_fila, build_stock_cards),
+]
+
+def best_of(function, df, repeat):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = function(df)
+        timings.append(time.perf_counter() - started)
+    return min(timings), result
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1_000, 5_000, 10_000, 20_000])
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=7)
+    args = parser.parse_args()
+
+    print(f"{'caso':<22} {'filas':>7} {'por fila':>10} {'vectorizado':>12} {'aceleración':>12}")
+    for label, make_frame, old, new in CASES:
+        for rows in args.sizes:
+            df = make_frame(rows, args.seed)
+            old_seconds, old_result = best_of(old, df, args.repeat)
+            new_seconds, new_result = best_of(new, df, args.repeat)
+            if isinstance(old_result, pd.DataFrame):
+                assert old_result['periodo_display'].tolist() == new_result['periodo_display'].tolist()
+            else:
+                assert json.dumps(old_result, cls=PlotlyJSONEncoder) == json.dumps(new_result, cls=PlotlyJSONEncoder)
+            print(f"{label:<22} {rows:>7} {old_seconds * 1000:>8.1f}ms {new_seconds * 1000:>10.1f}ms {old_seconds / new_seconds:>11.1f}x")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,239 @@
+# Sustituto local de Supabase para medir el panel sin tocar producción.
+# Atiende POST /rest/v1/rpc/{ejecutar_sql, ejecutar_sql_lote, dashboard_lote, dashboard_*} como
+# PostgREST y ejecuta el SQL real de appMonitoreo sobre SQLite, traduciendo las
+# pocas funciones propias de Postgres. Los datos salen de synthetic_data.py y
+# un hilo inserta pedidos nuevos para que el panel tenga cambios que enviar.
+# --error-rate responde 503 a una fracción de las llamadas (backend degradado).
+# --without-batch simula un Supabase sin las funciones por lotes (404 PGRST202).
+#   python benchmarks/fake_supabase.py --port 54321 --scale 1 --latency-ms 20
+#   DASHBOARD_SUPABASE_URL=http://127.0.0.1:54321 python appMonitoreo.py
+import argparse
+import json
+import os
+import random
+import re
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from synthetic_data import generate_orders, generate_tables  # noqa: E402
+
+SQL_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'sql')
+
+TRANSLATIONS = [
+    (re.compile(r"EXTRACT\(YEAR FROM ([\w.]+)\)"), r"CAST(strftime('%Y', \1) AS INTEGER)"),
+    (re.compile(r"EXTRACT\(MONTH FROM ([\w.]+)\)"), r"CAST(strftime('%m', \1) AS INTEGER)"),
+    (re.compile(r"TO_CHAR\(([\w.]+), 'YYYY-MM'\)"), r"strftime('%Y-%m', \1)"),
+    (re.compile(r"(?:DATE|TIMESTAMP) '([^']*)'"), lambda m: "'" + m.group(1).replace(' ', 'T') + "'"),
+]
+
+REFRESH_ROLLUPS_SQL = """
+    DELETE FROM ventas_diarias_distrito WHERE dia >= :desde;
+    DELETE FROM ventas_diarias_producto WHERE dia >= :desde;
+    INSERT INTO ventas_diarias_distrito (dia, distrito_id, total, pedidos)
+    SELECT date(o.fecha), COALESCE(cl.distrito_id, 0), SUM(o.total), COUNT(*)
+    FROM pedidos o
+    LEFT JOIN users cl ON o.cliente_id = cl.cliente_id
+    WHERE o.fecha >= :desde
+    GROUP BY 1, 2;
+    INSERT INTO ventas_diarias_producto (dia, producto_codigo, categoria_id, unidades, ingresos)
+    SELECT date(o.fecha), dp.producto_codigo, MAX(p.categoria_id), SUM(dp.cantidad), SUM(dp.cantidad * dp.precio_unit)
+    FROM detalle_pedido dp
+    JOIN pedidos o ON dp.pedido_id = o.id
+    LEFT JOIN productos p ON dp.producto_codigo = p.codigo
+    WHERE o.fecha >= :desde
+    GROUP BY 1, 2;
+    INSERT INTO clientes_primer_pedido (cliente_id, primer_pedido)
+    SELECT cliente_id, date(MIN(fecha))
+    FROM pedidos
+    WHERE fecha >= :desde
+    GROUP BY cliente_id
+    ON CONFLICT (cliente_id) DO UPDATE SET primer_pedido = MIN(primer_pedido, excluded.primer_pedido);
+"""
+
+def translate(sql):
+    for pattern, replacement in TRANSLATIONS:
+        sql = pattern.sub(replacement, sql)
+    return sql
+
+def refresh_rollups(conn, desde):
+    for statement in REFRESH_ROLLUPS_SQL.split(';'):
+        if statement.strip():
+            conn.execute(statement, {'desde': desde})
+    conn.commit()
+
+def build_database(path, scale, seed, days):
+    conn = sqlite3.connect(path)
+    conn.execute('PRAGMA journal_mode=WAL')
+    for name, df in generate_tables(scale, seed, days).items():
+        df.to_sql(name, conn, index=False)
+    with open(os.path.join(SQL_DIR, 'indices_dashboard.sql'), encoding='utf-8') as f:
+        conn.executescript(f.read())
+    # Solo las tablas de sql/rollups.sql; la función de refresco es plpgsql
+    with open(os.path.join(SQL_DIR, 'rollups.sql'), encoding='utf-8') as f:
+        conn.executescript(f.read().split('CREATE OR REPLACE FUNCTION')[0])
+    refresh_rollups(conn, '0000-01-01')
+    conn.execute('ANALYZE')
+    conn.commit()
+    conn.close()
+
+class OrderWriter(threading.Thread):
+    # Inserta pedidos con la hora actual y refresca los agregados de hoy,
+    # como el cron de refrescar_rollups_dashboard
+    def __init__(self, path, per_minute, seed):
+        super().__init__(daemon=True)
+        self.path = path
+        self.interval = 60 / per_minute
+        self.rng = np.random.default_rng(seed + 1)
+
+    def run(self):
+        conn = sqlite3.connect(self.path)
+        catalog = {
+            'productos': pd.read_sql('SELECT codigo, precio FROM productos', conn),
+            'users': pd.read_sql('SELECT cliente_id FROM users', conn),
+        }
+        while True:
+            time.sleep(self.interval)
+            now = pd.Timestamp.now().floor('s')
+            first_id, first_line_id = conn.execute(
+                'SELECT (SELECT MAX(id) FROM pedidos) + 1, (SELECT MAX(id) FROM detalle_pedido) + 1').fetchone()
+            pedidos, detalle = generate_orders(self.rng, catalog, first_id, 1, now, 1, first_line_id)
+            pedidos.to_sql('pedidos', conn, index=False, if_exists='append')
+            detalle.to_sql('detalle_pedido', conn, index=False, if_exists='append')
+            refresh_rollups(conn, now.date().isoformat())
+
+class FakeSupabase(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, path, latency, error_rate=0.0, batch=True):
+        super().__init__(address, RpcHandler)
+        self.path = path
+        self.latency = latency
+        self.error_rate = error_rate
+        self.batch = batch
+        self.local = threading.local()
+        self.lock = threading.Lock()
+        self.calls = Counter()
+        self.queries = 0
+        self.rows = 0
+        self.query_seconds = 0.0
+        self._specs = None
+
+    def connection(self):
+        conn = getattr(self.local, 'conn', None)
+        if conn is None:
+            conn = self.local.conn = sqlite3.connect(self.path)
+        return conn
+
+    def specs(self):
+        # Las funciones dashboard_* son las consultas registradas en appMonitoreo
+        if self._specs is None:
+            sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+            from appMonitoreo import QUERIES
+            self._specs = {spec.function_name: spec for spec in QUERIES.values()}
+        return self._specs
+
+    def execute(self, sql):
+        started = time.perf_counter()
+        cursor = self.connection().execute(translate(sql))
+        names = [column[0] for column in cursor.description]
+        rows = [dict(zip(names, row)) for row in cursor.fetchall()]
+        with self.lock:
+            self.queries += 1
+            self.rows += len(rows)
+            self.query_seconds += time.perf_counter() - started
+        return rows
+
+    def call(self, function, payload):
+        if function == 'ejecutar_sql':
+            return self.execute(payload['query'])
+        if function in ('ejecutar_sql_lote', 'dashboard_lote') and not self.batch:
+            raise LookupError(function)
+        if function == 'ejecutar_sql_lote':
+            return {name: self.execute(sql) for name, sql in payload['queries'].items()}
+        if function == 'dashboard_lote':
+            return {name: self.call(call_name, params) for name, (call_name, params) in payload['llamadas'].items()}
+        spec = self.specs().get(function)
+        if spec is None:
+            raise LookupError(function)
+        return self.execute(spec.bind(**{name[len('p_'):]: value for name, value in payload.items()}).sql)
+
+    def stats(self):
+        with self.lock:
+            return {'calls': dict(self.calls), 'queries': self.queries, 'rows': self.rows, 'query_seconds': round(self.query_seconds, 3)}
+
+class RpcHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_POST(self):
+        match = re.fullmatch(r'/rest/v1/rpc/(\w+)', self.path.split('?')[0])
+        payload = json.loads(self.rfile.read(int(self.headers.get('Content-Length') or 0)) or b'{}')
+        if match is None:
+            return self.reply(404, {'code': 'PGRST125', 'message': f'Ruta no válida: {self.path}'})
+        function = match.group(1)
+        with self.server.lock:
+            self.server.calls[function] += 1
+        time.sleep(self.server.latency)
+        if random.random() < self.server.error_rate:
+            return self.reply(503, {'code': 'PGRST001', 'message': 'Database client error. Retrying the connection.'})
+        try:
+            data = self.server.call(function, payload)
+        except LookupError:
+            return self.reply(404, {'code': 'PGRST202', 'message': f'Could not find the function public.{function}'})
+        except sqlite3.Error as exc:
+            return self.reply(400, {'code': '42601', 'message': str(exc)})
+        self.reply(200, [{'data': data}])
+
+    def do_GET(self):
+        if self.path == '/stats':
+            return self.reply(200, self.server.stats())
+        self.reply(404, {'message': 'no encontrado'})
+
+    def reply(self, status, body):
+        encoded = json.dumps(body, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(encoded)))
+        self.end_headers()
+        self.wfile.write(encoded)
+
+    def log_message(self, format, *args):
+        pass
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=54321)
+    parser.add_argument('--scale', type=float, default=1.0)
+    parser.add_argument('--seed', type=int, default=7)
+    parser.add_argument('--days', type=int, default=730)
+    parser.add_argument('--latency-ms', type=float, default=20, help='latencia de red simulada por llamada')
+    parser.add_argument('--orders-per-minute', type=float, default=30, help='0 para datos estáticos')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='fracción de llamadas que responden 503')
+    parser.add_argument('--without-batch', action='store_true', help='sin ejecutar_sql_lote ni dashboard_lote')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix='fake-supabase-') as directory:
+        path = os.path.join(directory, 'dashboard.sqlite')
+        build_database(path, args.scale, args.seed, args.days)
+        if args.orders_per_minute > 0:
+            OrderWriter(path, args.orders_per_minute, args.seed).start()
+        httpd = FakeSupabase((args.host, args.port), path, args.latency_ms / 1000, args.error_rate,
+                             batch=not args.without_batch)
+        print(f"escuchando en http://{args.host}:{httpd.server_address[1]}", flush=True)
+        try:
+            httpd.serve_forever()
+        except KeyboardInterrupt:
+            pass
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,143 @@
+# Datos sintéticos con semilla para las tablas que lee el panel. La escala
+# multiplica los tamaños base (escala 1: 20 mil pedidos en dos años).
+#   python benchmarks/synthetic_data.py --scale 5
+import argparse
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+BASE_ROWS = {
+    'productos': 60,
+    'users': 2_000,
+    'pedidos': 20_000,
+    'movimientos_inventario': 30_000,
+    'ordenes_fabricacion': 3_000,
+}
+
+CATEGORIAS = ['Brasieres', 'Calzones', 'Bodies', 'Pijamas', 'Fajas', 'Baby dolls', 'Medias', 'Accesorios']
+DISTRITOS = [f'Distrito {i:02d}' for i in range(1, 44)]
+TALLAS = ['XS', 'S', 'M', 'L', 'XL']
+COLORES = ['negro', 'blanco', 'rojo', 'nude', 'rosa', 'azul', 'vino', 'verde']
+COLORES_POR_PRODUCTO = 3
+TIPOS_MOVIMIENTO = ['ingreso_lote_fabricacion', 'ajuste_positivo', 'salida_venta', 'ajuste_negativo']
+PESOS_MOVIMIENTO = [0.3, 0.05, 0.6, 0.05]
+ESTADOS_FABRICACION = ['planificada', 'en_proceso', 'pausada', 'finalizado', 'cancelada']
+PESOS_FABRICACION = [0.1, 0.15, 0.05, 0.65, 0.05]
+
+def scaled(table, scale):
+    return max(1, int(BASE_ROWS[table] * scale))
+
+def timestamps(rng, count, start, seconds):
+    offsets = np.sort(rng.integers(0, max(seconds, 1), count))
+    return (start + pd.to_timedelta(offsets, unit='s')).strftime('%Y-%m-%dT%H:%M:%S')
+
+def generate_catalog(rng, scale):
+    productos_count = scaled('productos', scale)
+    codigos = [f'P{i:05d}' for i in range(1, productos_count + 1)]
+    productos = pd.DataFrame({
+        'codigo': codigos,
+        'nombre': [f'Producto {i}' for i in range(1, productos_count + 1)],
+        'categoria_id': rng.integers(1, len(CATEGORIAS) + 1, productos_count),
+        'precio': rng.uniform(15, 180, productos_count).round(2),
+    })
+    colores = [rng.choice(COLORES, COLORES_POR_PRODUCTO, replace=False) for _ in codigos]
+    variantes = pd.DataFrame(
+        [(codigo, talla, color) for codigo, colores_producto in zip(codigos, colores)
+         for talla in TALLAS for color in colores_producto],
+        columns=['producto_codigo', 'talla', 'color'],
+    )
+    variantes.insert(0, 'id', np.arange(1, len(variantes) + 1))
+    # Cola larga: la mayoría con stock holgado y algunas bajo el umbral crítico
+    variantes['cantidad'] = np.where(rng.random(len(variantes)) < 0.15,
+                                     rng.integers(0, 10, len(variantes)),
+                                     rng.integers(10, 400, len(variantes)))
+    users_count = scaled('users', scale)
+    return OrderedDict([
+        ('categorias', pd.DataFrame({'categoria_id': np.arange(1, len(CATEGORIAS) + 1), 'nombre': CATEGORIAS})),
+        ('distritos', pd.DataFrame({'distrito_id': np.arange(1, len(DISTRITOS) + 1), 'nombre': DISTRITOS})),
+        ('productos', productos),
+        ('variantes_producto', variantes),
+        ('users', pd.DataFrame({
+            'cliente_id': np.arange(1, users_count + 1),
+            'distrito_id': rng.integers(1, len(DISTRITOS) + 1, users_count),
+        })),
+    ])
+
+def first_customers(rng, users, count):
+    # Los clientes se van sumando con el tiempo: los pedidos más recientes
+    # pueden venir de cualquiera y así cada mes hay compradores nuevos
+    reach = 0.2 + 0.8 * np.arange(1, count + 1) / count
+    return 1 + (rng.random(count) * reach * users).astype(np.int64)
+
+def generate_orders(rng, catalog, first_id, count, start, seconds, first_line_id=1):
+    # Pedidos con 1 a 4 líneas; el total del pedido es la suma de sus líneas
+    productos = catalog['productos']
+    ids = np.arange(first_id, first_id + count)
+    lines_per_order = rng.integers(1, 5, count)
+    producto = rng.integers(0, len(productos), lines_per_order.sum())
+    detalle = pd.DataFrame({
+        'id': np.arange(first_line_id, first_line_id + lines_per_order.sum()),
+        'pedido_id': np.repeat(ids, lines_per_order),
+        'producto_codigo': productos['codigo'].to_numpy()[producto],
+        'cantidad': rng.integers(1, 4, len(producto)),
+        'precio_unit': productos['precio'].to_numpy()[producto],
+    })
+    totals = np.bincount(detalle['pedido_id'] - first_id,
+                         weights=detalle['cantidad'] * detalle['precio_unit'], minlength=count)
+    pedidos = pd.DataFrame({
+        'id': ids,
+        'cliente_id': first_customers(rng, len(catalog['users']), count),
+        'fecha': timestamps(rng, count, start, seconds),
+        'total': totals.round(2),
+    })
+    return pedidos, detalle
+
+def generate_movements(rng, catalog, count, start, seconds):
+    return pd.DataFrame({
+        'id': np.arange(1, count + 1),
+        'variante_id': rng.integers(1, len(catalog['variantes_producto']) + 1, count),
+        'tipo_movimiento': rng.choice(TIPOS_MOVIMIENTO, count, p=PESOS_MOVIMIENTO),
+        'cantidad_afectada': rng.integers(1, 50, count),
+        'fecha_movimiento': timestamps(rng, count, start, seconds),
+    })
+
+def generate_manufacturing(rng, catalog, count, start, seconds):
+    creacion = pd.to_datetime(timestamps(rng, count, start, seconds))
+    estado = rng.choice(ESTADOS_FABRICACION, count, p=PESOS_FABRICACION)
+    fin = (creacion + pd.to_timedelta(rng.integers(1, 30, count), unit='D')).strftime('%Y-%m-%dT%H:%M:%S')
+    return pd.DataFrame({
+        'id': np.arange(1, count + 1),
+        'variante_id': rng.integers(1, len(catalog['variantes_producto']) + 1, count),
+        'cantidad_a_fabricar': rng.integers(10, 200, count),
+        'estado_fabricacion': estado,
+        'fecha_creacion': creacion.strftime('%Y-%m-%dT%H:%M:%S'),
+        'fecha_fin_fabricacion': np.where(estado == 'finalizado', fin, None),
+    })
+
+def generate_tables(scale=1.0, seed=7, days=730, now=None):
+    rng = np.random.default_rng(seed)
+    now = pd.Timestamp.now().floor('s') if now is None else pd.Timestamp(now)
+    start, seconds = now - pd.Timedelta(days=days), days * 86_400
+    tables = generate_catalog(rng, scale)
+    tables['pedidos'], tables['detalle_pedido'] = generate_orders(
+        rng, tables, 1, scaled('pedidos', scale), start, seconds)
+    tables['movimientos_inventario'] = generate_movements(
+        rng, tables, scaled('movimientos_inventario', scale), start, seconds)
+    tables['ordenes_fabricacion'] = generate_manufacturing(
+        rng, tables, scaled('ordenes_fabricacion', scale), start, seconds)
+    return tables
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--scale', type=float, default=1.0)
+    parser.add_argument('--seed', type=int, default=7)
+    parser.add_argument('--days', type=int, default=730)
+    args = parser.parse_args()
+
+    tables = generate_tables(args.scale, args.seed, args.days)
+    for name, df in tables.items():
+        print(f"{name:<24} {len(df):>10,} filas {df.memory_usage(deep=True).sum() / 2**20:>8.1f} MB")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,27 @@
+# Configuración de gunicorn para el panel:
+#   gunicorn -c gunicorn.conf.py
+# Sin preload cada worker importa appMonitoreo (barato) y llama a create_app().
+# Con DASHBOARD_PRELOAD=1 el maestro arma la app e importa pandas, plotly y dash
+# una sola vez; los workers nacen por fork con todo cargado y post_fork les da
+# caches, clientes HTTP e hilos propios.
+import os
+import time
+
+bind = os.environ.get('DASHBOARD_BIND', '0.0.0.0:8050')
+workers = int(os.environ.get('DASHBOARD_WORKERS', '2'))
+threads = int(os.environ.get('DASHBOARD_THREADS', '8'))
+# Cada flujo de /dashboard/events ocupa un hilo: la mitad queda para callbacks
+os.environ.setdefault('DASHBOARD_PUSH_MAX_STREAMS', str(max(1, threads // 2)))
+preload_app = os.environ.get('DASHBOARD_PRELOAD', '0') == '1'
+wsgi_app = 'appMonitoreo:create_app()'
+
+def pre_fork(server, worker):
+    worker.forked_at = time.monotonic()
+
+def post_fork(server, worker):
+    if server.cfg.preload_app:
+        import appMonitoreo
+        appMonitoreo.init_runtime()
+
+def post_worker_init(worker):
+    worker.log.info("Worker %s listo en %.3fs", worker.pid, time.monotonic() - worker.forked_at)
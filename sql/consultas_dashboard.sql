@@ -0,0 +1,416 @@
+-- Una función por consulta registrada en appMonitoreo.py (register_query).
+-- Se usan con DASHBOARD_PREPARED_RPC=1: PL/pgSQL prepara el plan de cada
+-- función la primera vez que se llama en una conexión y lo reutiliza después.
+-- Generado con:
+--   python -c "import appMonitoreo; print(appMonitoreo.query_functions_sql())" > sql/consultas_dashboard.sql
+-- más los GRANT del final.
+
+CREATE OR REPLACE FUNCTION dashboard_sales_monthly_totals(p_desde date)
+RETURNS TABLE(data jsonb)
+LANGUAGE plpgsql
+STABLE
+AS $$
+BEGIN
+    RETURN QUERY SELECT COALESCE(jsonb_agg(t), '[]'::jsonb) FROM (
+        SELECT EXTRACT(YEAR FROM fecha) AS año,
+               EXTRACT(MONTH FROM fecha) AS mes,
+               SUM(total) AS total,
+               MAX(fecha) AS watermark
+        FROM pedidos
+        WHERE fecha >= p_desde
+        GROUP BY año, mes
+    ) t;
+END;
+$$;
+
+CREATE OR REPLACE FUNCTION dashboard_sales_last_two_months(p_desde date, p_hasta date)
+RETURNS TABLE(data jsonb)
+LANGUAGE plpgsql
+STABLE
+AS $$
+BEGIN
+    RETURN QUERY SELECT COALESCE(jsonb_agg(t), '[]'::jsonb) FROM (
+        SELECT TO_CHAR(fecha, 'YYYY-MM') AS periodo,
+               EXTRACT(MONTH FROM fecha) AS mes,
+               EXTRACT(YEAR FROM fecha) AS año,
+               SUM(total) AS total
+        FROM pedidos
+        WHERE fecha >= p_desde
+          AND fecha < p_hasta
+        GROUP BY periodo, mes, año
+        ORDER BY periodo
+    ) t;
+END;
+$$;
+
+CREATE OR REPLACE FUNCTION dashboard_sales_top_products(p_inicio date, p_fin date)
+RETURNS TABLE(data jsonb)
+LANGUAGE plpgsql
+STABLE
+AS $$
+BEGIN
+    RETURN QUERY SELECT COALESCE(jsonb_agg(t), '[]'::jsonb) FROM (
+        SELECT p.nombre AS producto,
+               SUM(dp.cantidad) AS unidades
+        FROM detalle_pedido dp
+        JOIN pedidos o ON dp.pedido_id = o.id
+        JOIN productos p ON dp.producto_codigo = p.codigo
+        WHERE o.fecha >= p_inicio AND o.fecha < p_fin
+        GROUP BY p.codigo, p.nombre
+        ORDER BY unidades DESC
+        LIMIT 10
+    ) t;
+END;
+$$;
+
+CREATE OR REPLACE FUNCTION dashboard_sales_revenue_by_category(p_inicio date, p_fin date)
+RETURNS TABLE(data jsonb)
+LANGUAGE plpgsql
+STABLE
+AS $$
+BEGIN
+    RETURN QUERY SELECT COALESCE(jsonb_agg(t), '[]'::jsonb) FROM (
+        SELECT c.nombre AS categoria,
+               SUM(dp.cantidad * dp.precio_unit) AS ingresos
+        FROM detalle_pedido dp
+        JOIN pedidos o ON dp.pedido_id = o.id
+        JOIN productos p ON dp.producto_codigo = p.codigo
+        JOIN categorias c ON p.categoria_id = c.categoria_id
+        WHERE o.fecha >= p_inicio AND o.fecha < p_fin
+        GROUP BY c.categoria_id, c.nombre
+        ORDER BY ingresos DESC
+    ) t;
+END;
+$$;
+
+CREATE OR REPLACE FUNCTION dashboard_sales_by_district(p_desde date, p_hasta date)
+RETURNS TABLE(data jsonb)
+LANGUAGE plpgsql
+STABLE
+AS $$
+BEGIN
+    RETURN QUERY SELECT COALESCE(jsonb_agg(t), '[]'::jsonb) FROM (
+        SELECT d.nombre AS distrito,
+               EXTRACT(MONTH FROM o.fecha) AS mes,
+               SUM(o.total) AS total
+        FROM pedidos o
+        JOIN users cl ON o.cliente_id = cl.cliente_id
+        JOIN distritos d ON cl.distrito_id = d.distrito_id
+        WHERE o.fecha >= p_desde
+          AND o.fecha < p_hasta
+        GROUP BY d.distrito_id, d.nombre, mes
+        ORDER BY d.nombre, mes
+    ) t;
+END;
+$$;
+
+CREATE OR REPLACE FUNCTION dashboard_sales_new_vs_returning(p_inicio date, p_fin date)
+RETURNS TABLE(data jsonb)
+LANGUAGE plpgsql
+STABLE
+AS $$
+BEGIN
+    RETURN QUERY SELECT COALESCE(jsonb_agg(t), '[]'::jsonb) FROM (
+        WITH first_orders AS (
+            SELECT cliente_id, MIN(fecha) AS first_order_date
+            FROM pedidos
+            GROUP BY cliente_id
+        ), current_orders AS (
+            SELECT DISTINCT o.cliente_id, f.first_order_date
+            FROM pedidos o
+            JOIN first_orders f USING(cliente_id)
+            WHERE o.fecha >= p_inicio AND o.fecha < p_fin
+        )
+        SELECT CASE
+                    WHEN first_order_date >= p_inicio AND first_order_date < p_fin
+                    THEN 'Nuevo'
+                    ELSE 'Recurrente'
+                END AS tipo_cliente,
+                COUNT(*) AS cantidad
+        FROM current_orders
+        GROUP BY tipo_cliente
+    ) t;
+END;
+$$;
+
+CREATE OR REPLACE FUNCTION dashboard_rollup_monthly_totals(p_desde date)
+RETURNS TABLE(data jsonb)
+LANGUAGE plpgsql
+STABLE
+AS $$
+BEGIN
+    RETURN QUERY SELECT COALESCE(jsonb_agg(t), '[]'::jsonb) FROM (
+        SELECT EXTRACT(YEAR FROM dia) AS año,
+               EXTRACT(MONTH FROM dia) AS mes,
+               SUM(total) AS total,
+               MAX(dia) AS watermark
+        FROM ventas_diarias_distrito
+        WHERE dia >= p_desde
+        GROUP BY año, mes
+    ) t;
+END;
+$$;
+
+CREATE OR REPLACE FUNCTION dashboard_rollup_last_two_months(p_desde date, p_hasta date)
+RETURNS TABLE(data jsonb)
+LANGUAGE plpgsql
+STABLE
+AS $$
+BEGIN
+    RETURN QUERY SELECT COALESCE(jsonb_agg(t), '[]'::jsonb) FROM (
+        SELECT TO_CHAR(dia, 'YYYY-MM') AS periodo,
+               EXTRACT(MONTH FROM dia) AS mes,
+               EXTRACT(YEAR FROM dia) AS año,
+               SUM(total) AS total
+        FROM ventas_diarias_distrito
+        WHERE dia >= p_desde
+          AND dia < p_hasta
+        GROUP BY periodo, mes, año
+        ORDER BY periodo
+    ) t;
+END;
+$$;
+
+CREATE OR REPLACE FUNCTION dashboard_rollup_top_products(p_inicio date, p_fin date)
+RETURNS TABLE(data jsonb)
+LANGUAGE plpgsql
+STABLE
+AS $$
+BEGIN
+    RETURN QUERY SELECT COALESCE(jsonb_agg(t), '[]'::jsonb) FROM (
+        SELECT p.nombre AS producto,
+               SUM(v.unidades) AS unidades
+        FROM ventas_diarias_producto v
+        JOIN productos p ON v.producto_codigo = p.codigo
+        WHERE v.dia >= p_inicio AND v.dia < p_fin
+        GROUP BY p.codigo, p.nombre
+        ORDER BY unidades DESC
+        LIMIT 10
+    ) t;
+END;
+$$;
+
+CREATE OR REPLACE FUNCTION dashboard_rollup_revenue_by_category(p_inicio date, p_fin date)
+RETURNS TABLE(data jsonb)
+LANGUAGE plpgsql
+STABLE
+AS $$
+BEGIN
+    RETURN QUERY SELECT COALESCE(jsonb_agg(t), '[]'::jsonb) FROM (
+        SELECT c.nombre AS categoria,
+               SUM(v.ingresos) AS ingresos
+        FROM ventas_diarias_producto v
+        JOIN categorias c ON v.categoria_id = c.categoria_id
+        WHERE v.dia >= p_inicio AND v.dia < p_fin
+        GROUP BY c.categoria_id, c.nombre
+        ORDER BY ingresos DESC
+    ) t;
+END;
+$$;
+
+CREATE OR REPLACE FUNCTION dashboard_rollup_by_district(p_desde date, p_hasta date)
+RETURNS TABLE(data jsonb)
+LANGUAGE plpgsql
+STABLE
+AS $$
+BEGIN
+    RETURN QUERY SELECT COALESCE(jsonb_agg(t), '[]'::jsonb) FROM (
+        SELECT d.nombre AS distrito,
+               EXTRACT(MONTH FROM v.dia) AS mes,
+               SUM(v.total) AS total
+        FROM ventas_diarias_distrito v
+        JOIN distritos d ON v.distrito_id = d.distrito_id
+        WHERE v.dia >= p_desde
+          AND v.dia < p_hasta
+        GROUP BY d.distrito_id, d.nombre, mes
+        ORDER BY d.nombre, mes
+    ) t;
+END;
+$$;
+
+CREATE OR REPLACE FUNCTION dashboard_rollup_new_vs_returning(p_inicio date, p_fin date)
+RETURNS TABLE(data jsonb)
+LANGUAGE plpgsql
+STABLE
+AS $$
+BEGIN
+    RETURN QUERY SELECT COALESCE(jsonb_agg(t), '[]'::jsonb) FROM (
+        SELECT CASE
+                    WHEN f.primer_pedido IS NULL
+                      OR (f.primer_pedido >= p_inicio AND f.primer_pedido < p_fin)
+                    THEN 'Nuevo'
+                    ELSE 'Recurrente'
+                END AS tipo_cliente,
+                COUNT(*) AS cantidad
+        FROM (
+            SELECT DISTINCT cliente_id
+            FROM pedidos
+            WHERE fecha >= p_inicio AND fecha < p_fin
+        ) o
+        LEFT JOIN clientes_primer_pedido f USING(cliente_id)
+        GROUP BY tipo_cliente
+    ) t;
+END;
+$$;
+
+CREATE OR REPLACE FUNCTION dashboard_inventory_stock_by_variant(p_signo integer, p_limite integer, p_desplazamiento integer)
+RETURNS TABLE(data jsonb)
+LANGUAGE plpgsql
+STABLE
+AS $$
+BEGIN
+    RETURN QUERY SELECT COALESCE(jsonb_agg(t), '[]'::jsonb) FROM (
+        SELECT vp.id AS variante_id, p.nombre AS nombre_producto, vp.talla, vp.color, vp.cantidad AS stock_actual,
+               COUNT(*) OVER() AS total_filas
+        FROM variantes_producto vp
+        JOIN productos p ON vp.producto_codigo = p.codigo
+        ORDER BY vp.cantidad * p_signo, vp.id
+        LIMIT p_limite OFFSET p_desplazamiento
+    ) t;
+END;
+$$;
+
+CREATE OR REPLACE FUNCTION dashboard_inventory_critical_stock(p_signo integer, p_limite integer, p_desplazamiento integer)
+RETURNS TABLE(data jsonb)
+LANGUAGE plpgsql
+STABLE
+AS $$
+BEGIN
+    RETURN QUERY SELECT COALESCE(jsonb_agg(t), '[]'::jsonb) FROM (
+        SELECT vp.id AS variante_id, p.nombre AS nombre_producto, vp.talla, vp.color, vp.cantidad AS stock_actual,
+               COUNT(*) OVER() AS total_filas
+        FROM variantes_producto vp
+        JOIN productos p ON vp.producto_codigo = p.codigo
+        WHERE vp.cantidad < 10
+        ORDER BY vp.cantidad * p_signo, vp.id
+        LIMIT p_limite OFFSET p_desplazamiento
+    ) t;
+END;
+$$;
+
+CREATE OR REPLACE FUNCTION dashboard_inventory_movements_monthly(p_desde date)
+RETURNS TABLE(data jsonb)
+LANGUAGE plpgsql
+STABLE
+AS $$
+BEGIN
+    RETURN QUERY SELECT COALESCE(jsonb_agg(t), '[]'::jsonb) FROM (
+        SELECT EXTRACT(MONTH FROM fecha_movimiento) AS mes,
+               EXTRACT(YEAR FROM fecha_movimiento) AS año,
+               SUM(CASE WHEN tipo_movimiento IN ('ingreso_lote_fabricacion', 'ajuste_positivo') THEN cantidad_afectada ELSE 0 END) AS entradas,
+               SUM(CASE WHEN tipo_movimiento IN ('salida_venta', 'ajuste_negativo') THEN cantidad_afectada ELSE 0 END) AS salidas,
+               MAX(fecha_movimiento) AS watermark
+        FROM movimientos_inventario
+        WHERE fecha_movimiento >= p_desde
+        GROUP BY EXTRACT(YEAR FROM fecha_movimiento), EXTRACT(MONTH FROM fecha_movimiento)
+    ) t;
+END;
+$$;
+
+CREATE OR REPLACE FUNCTION dashboard_inventory_production_monthly(p_desde date)
+RETURNS TABLE(data jsonb)
+LANGUAGE plpgsql
+STABLE
+AS $$
+BEGIN
+    RETURN QUERY SELECT COALESCE(jsonb_agg(t), '[]'::jsonb) FROM (
+        SELECT EXTRACT(YEAR FROM fecha_fin_fabricacion) AS año,
+               EXTRACT(MONTH FROM fecha_fin_fabricacion) AS mes,
+               SUM(cantidad_a_fabricar) AS total_unidades_producidas
+        FROM ordenes_fabricacion
+        WHERE estado_fabricacion = 'finalizado'
+          AND fecha_fin_fabricacion >= p_desde
+        GROUP BY año, mes
+        ORDER BY año, mes
+    ) t;
+END;
+$$;
+
+CREATE OR REPLACE FUNCTION dashboard_inventory_manufacturing_status(p_inicio date, p_fin date)
+RETURNS TABLE(data jsonb)
+LANGUAGE plpgsql
+STABLE
+AS $$
+BEGIN
+    RETURN QUERY SELECT COALESCE(jsonb_agg(t), '[]'::jsonb) FROM (
+        SELECT estado_fabricacion, COUNT(id) AS numero_de_ordenes
+        FROM ordenes_fabricacion
+        WHERE fecha_creacion >= p_inicio AND fecha_creacion < p_fin
+          AND estado_fabricacion IN ('en_proceso', 'finalizado')
+        GROUP BY estado_fabricacion
+        ORDER BY numero_de_ordenes DESC
+    ) t;
+END;
+$$;
+
+CREATE OR REPLACE FUNCTION dashboard_inventory_pending_orders(p_signo integer, p_limite integer, p_desplazamiento integer)
+RETURNS TABLE(data jsonb)
+LANGUAGE plpgsql
+STABLE
+AS $$
+BEGIN
+    RETURN QUERY SELECT COALESCE(jsonb_agg(t), '[]'::jsonb) FROM (
+        SELECT of.variante_id, p.nombre AS nombre_producto, vp.talla, vp.color,
+               SUM(of.cantidad_a_fabricar) AS cantidad_pendiente_fabricacion,
+               COUNT(*) OVER() AS total_filas
+        FROM ordenes_fabricacion of
+        JOIN variantes_producto vp ON of.variante_id = vp.id
+        JOIN productos p ON vp.producto_codigo = p.codigo
+        WHERE of.estado_fabricacion IN ('en_proceso', 'planificada', 'pausada')
+        GROUP BY of.variante_id, p.nombre, vp.talla, vp.color
+        ORDER BY SUM(of.cantidad_a_fabricar) * p_signo, of.variante_id
+        LIMIT p_limite OFFSET p_desplazamiento
+    ) t;
+END;
+$$;
+
+CREATE OR REPLACE FUNCTION dashboard_inventory_stock_by_product()
+RETURNS TABLE(data jsonb)
+LANGUAGE plpgsql
+STABLE
+AS $$
+BEGIN
+    RETURN QUERY SELECT COALESCE(jsonb_agg(t), '[]'::jsonb) FROM (
+        SELECT p.nombre AS nombre_producto, SUM(vp.cantidad) AS stock_total
+        FROM productos p
+        JOIN variantes_producto vp ON p.codigo = vp.producto_codigo
+        GROUP BY p.codigo, p.nombre
+        ORDER BY stock_total DESC
+    ) t;
+END;
+$$;
+
+CREATE OR REPLACE FUNCTION dashboard_changes_watermarks()
+RETURNS TABLE(data jsonb)
+LANGUAGE plpgsql
+STABLE
+AS $$
+BEGIN
+    RETURN QUERY SELECT COALESCE(jsonb_agg(t), '[]'::jsonb) FROM (
+        SELECT (SELECT MAX(id) FROM pedidos) AS pedidos,
+               (SELECT MAX(id) FROM movimientos_inventario) AS movimientos_inventario,
+               (SELECT MAX(id) FROM ordenes_fabricacion) AS ordenes_fabricacion
+    ) t;
+END;
+$$;
+
+GRANT EXECUTE ON FUNCTION dashboard_sales_monthly_totals TO anon, authenticated;
+GRANT EXECUTE ON FUNCTION dashboard_sales_last_two_months TO anon, authenticated;
+GRANT EXECUTE ON FUNCTION dashboard_sales_top_products TO anon, authenticated;
+GRANT EXECUTE ON FUNCTION dashboard_sales_revenue_by_category TO anon, authenticated;
+GRANT EXECUTE ON FUNCTION dashboard_sales_by_district TO anon, authenticated;
+GRANT EXECUTE ON FUNCTION dashboard_sales_new_vs_returning TO anon, authenticated;
+GRANT EXECUTE ON FUNCTION dashboard_rollup_monthly_totals TO anon, authenticated;
+GRANT EXECUTE ON FUNCTION dashboard_rollup_last_two_months TO anon, authenticated;
+GRANT EXECUTE ON FUNCTION dashboard_rollup_top_products TO anon, authenticated;
+GRANT EXECUTE ON FUNCTION dashboard_rollup_revenue_by_category TO anon, authenticated;
+GRANT EXECUTE ON FUNCTION dashboard_rollup_by_district TO anon, authenticated;
+GRANT EXECUTE ON FUNCTION dashboard_rollup_new_vs_returning TO anon, authenticated;
+GRANT EXECUTE ON FUNCTION dashboard_inventory_stock_by_variant TO anon, authenticated;
+GRANT EXECUTE ON FUNCTION dashboard_inventory_critical_stock TO anon, authenticated;
+GRANT EXECUTE ON FUNCTION dashboard_inventory_movements_monthly TO anon, authenticated;
+GRANT EXECUTE ON FUNCTION dashboard_inventory_production_monthly TO anon, authenticated;
+GRANT EXECUTE ON FUNCTION dashboard_inventory_manufacturing_status TO anon, authenticated;
+GRANT EXECUTE ON FUNCTION dashboard_inventory_pending_orders TO anon, authenticated;
+GRANT EXECUTE ON FUNCTION dashboard_inventory_stock_by_product TO anon, authenticated;
+GRANT EXECUTE ON FUNCTION dashboard_changes_watermarks TO anon, authenticated;
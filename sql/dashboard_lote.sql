@@ -0,0 +1,33 @@
+-- Variante por lotes de las funciones de sql/consultas_dashboard.sql para
+-- DASHBOARD_PREPARED_RPC=1: recibe {"nombre": ["dashboard_...", {"p_desde": "..."}]}
+-- y devuelve una sola fila con {"nombre": [filas...]}. Cada llamada conserva
+-- el plan preparado de su función; solo se aceptan funciones dashboard_*.
+CREATE OR REPLACE FUNCTION dashboard_lote(llamadas jsonb)
+RETURNS TABLE(data jsonb)
+LANGUAGE plpgsql
+STABLE
+AS $$
+DECLARE
+    nombre text;
+    llamada jsonb;
+    funcion text;
+    argumentos text;
+    filas jsonb;
+    resultado jsonb := '{}'::jsonb;
+BEGIN
+    FOR nombre, llamada IN SELECT key, value FROM jsonb_each(llamadas) LOOP
+        funcion := llamada->>0;
+        IF funcion NOT LIKE 'dashboard\_%' OR funcion = 'dashboard_lote' THEN
+            RAISE EXCEPTION 'función no permitida en el lote: %', funcion;
+        END IF;
+        SELECT string_agg(format('%I => %L', key, value), ', ')
+        INTO argumentos
+        FROM jsonb_each_text(COALESCE(llamada->1, '{}'::jsonb));
+        EXECUTE format('SELECT data FROM %I(%s)', funcion, COALESCE(argumentos, '')) INTO filas;
+        resultado := resultado || jsonb_build_object(nombre, COALESCE(filas, '[]'::jsonb));
+    END LOOP;
+    RETURN QUERY SELECT resultado;
+END;
+$$;
+
+GRANT EXECUTE ON FUNCTION dashboard_lote(jsonb) TO anon, authenticated;
@@ -0,0 +1,24 @@
+-- Variante por lotes de ejecutar_sql: recibe {"nombre": "SELECT ..."} y
+-- devuelve una sola fila con {"nombre": [filas...]}, de modo que una pestaña
+-- del dashboard se resuelve con un único viaje HTTP.
+-- Mismos permisos que ejecutar_sql.
+CREATE OR REPLACE FUNCTION ejecutar_sql_lote(queries jsonb)
+RETURNS TABLE(data jsonb)
+LANGUAGE plpgsql
+STABLE
+AS $$
+DECLARE
+    nombre text;
+    consulta text;
+    filas jsonb;
+    resultado jsonb := '{}'::jsonb;
+BEGIN
+    FOR nombre, consulta IN SELECT key, value FROM jsonb_each_text(queries) LOOP
+        EXECUTE format('SELECT COALESCE(jsonb_agg(t), ''[]''::jsonb) FROM (%s) t', consulta) INTO filas;
+        resultado := resultado || jsonb_build_object(nombre, filas);
+    END LOOP;
+    RETURN QUERY SELECT resultado;
+END;
+$$;
+
+GRANT EXECUTE ON FUNCTION ejecutar_sql_lote(jsonb) TO anon, authenticated;
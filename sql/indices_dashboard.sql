@@ -0,0 +1,25 @@
+-- Índices que acompañan a los rangos semiabiertos generados por DateContext
+-- (fecha >= DATE 'inicio' AND fecha < DATE 'fin'). Con EXTRACT(... FROM fecha)
+-- ningún índice btree sobre la columna podía usarse y cada refresco recorría
+-- pedidos y ordenes_fabricacion completos.
+-- En tablas grandes conviene ejecutarlos uno a uno con CREATE INDEX CONCURRENTLY
+-- fuera de una transacción.
+
+-- Top productos, ingresos por categoría, ventas por distrito, ganancia del mes
+CREATE INDEX IF NOT EXISTS pedidos_fecha_idx ON pedidos (fecha);
+
+-- first_orders: MIN(fecha) por cliente sin ordenar toda la tabla
+CREATE INDEX IF NOT EXISTS pedidos_cliente_fecha_idx ON pedidos (cliente_id, fecha);
+
+CREATE INDEX IF NOT EXISTS detalle_pedido_pedido_idx ON detalle_pedido (pedido_id);
+
+-- Movimientos de inventario (lectura incremental por marca de agua)
+CREATE INDEX IF NOT EXISTS movimientos_inventario_fecha_idx ON movimientos_inventario (fecha_movimiento);
+
+-- Órdenes del trimestre actual
+CREATE INDEX IF NOT EXISTS ordenes_fabricacion_creacion_idx ON ordenes_fabricacion (fecha_creacion);
+
+-- Producción mensual: solo órdenes finalizadas
+CREATE INDEX IF NOT EXISTS ordenes_fabricacion_fin_finalizado_idx
+    ON ordenes_fabricacion (fecha_fin_fabricacion)
+    WHERE estado_fabricacion = 'finalizado';
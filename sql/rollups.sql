@@ -0,0 +1,90 @@
+-- Agregados diarios que lee el panel con DASHBOARD_USE_ROLLUPS=1.
+-- Las consultas rollup.* de appMonitoreo.py recorren un registro por día
+-- (y distrito o producto) en lugar de cada pedido, y el primer pedido de cada
+-- cliente queda guardado en vez de calcular MIN(fecha) sobre todo pedidos.
+--
+-- Son tablas y no vistas materializadas: REFRESH MATERIALIZED VIEW vuelve a
+-- leer la tabla completa, mientras que refrescar_rollups_dashboard solo
+-- recalcula los días desde p_desde (por defecto ayer y hoy).
+--
+-- Carga inicial:   SELECT refrescar_rollups_dashboard(NULL);
+-- Mantenimiento:   SELECT cron.schedule('rollups-dashboard', '* * * * *',
+--                      'SELECT refrescar_rollups_dashboard()');
+
+CREATE TABLE IF NOT EXISTS ventas_diarias_distrito (
+    dia date NOT NULL,
+    distrito_id integer NOT NULL,
+    total numeric NOT NULL,
+    pedidos integer NOT NULL,
+    PRIMARY KEY (dia, distrito_id)
+);
+
+CREATE TABLE IF NOT EXISTS ventas_diarias_producto (
+    dia date NOT NULL,
+    producto_codigo text NOT NULL,
+    categoria_id integer,
+    unidades numeric NOT NULL,
+    ingresos numeric NOT NULL,
+    PRIMARY KEY (dia, producto_codigo)
+);
+
+CREATE INDEX IF NOT EXISTS ventas_diarias_producto_categoria_idx
+    ON ventas_diarias_producto (dia, categoria_id);
+
+CREATE TABLE IF NOT EXISTS clientes_primer_pedido (
+    cliente_id integer PRIMARY KEY,
+    primer_pedido date NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS clientes_primer_pedido_fecha_idx
+    ON clientes_primer_pedido (primer_pedido);
+
+-- Pedidos sin distrito conocido se agrupan en distrito_id 0 para que el total
+-- mensual coincida con la suma de pedidos.
+CREATE OR REPLACE FUNCTION refrescar_rollups_dashboard(p_desde date DEFAULT CURRENT_DATE - 1)
+RETURNS void
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    IF p_desde IS NULL THEN
+        TRUNCATE ventas_diarias_distrito, ventas_diarias_producto, clientes_primer_pedido;
+        p_desde := '-infinity'::date;
+    ELSE
+        DELETE FROM ventas_diarias_distrito WHERE dia >= p_desde;
+        DELETE FROM ventas_diarias_producto WHERE dia >= p_desde;
+    END IF;
+
+    INSERT INTO ventas_diarias_distrito (dia, distrito_id, total, pedidos)
+    SELECT o.fecha::date,
+           COALESCE(cl.distrito_id, 0),
+           SUM(o.total),
+           COUNT(*)
+    FROM pedidos o
+    LEFT JOIN users cl ON o.cliente_id = cl.cliente_id
+    WHERE o.fecha >= p_desde
+    GROUP BY 1, 2;
+
+    INSERT INTO ventas_diarias_producto (dia, producto_codigo, categoria_id, unidades, ingresos)
+    SELECT o.fecha::date,
+           dp.producto_codigo,
+           MAX(p.categoria_id),
+           SUM(dp.cantidad),
+           SUM(dp.cantidad * dp.precio_unit)
+    FROM detalle_pedido dp
+    JOIN pedidos o ON dp.pedido_id = o.id
+    LEFT JOIN productos p ON dp.producto_codigo = p.codigo
+    WHERE o.fecha >= p_desde
+    GROUP BY 1, 2;
+
+    INSERT INTO clientes_primer_pedido (cliente_id, primer_pedido)
+    SELECT cliente_id, MIN(fecha)::date
+    FROM pedidos
+    WHERE fecha >= p_desde
+    GROUP BY cliente_id
+    ON CONFLICT (cliente_id) DO UPDATE
+        SET primer_pedido = LEAST(clientes_primer_pedido.primer_pedido, EXCLUDED.primer_pedido);
+END;
+$$;
+
+GRANT SELECT ON ventas_diarias_distrito, ventas_diarias_producto, clientes_primer_pedido
+    TO anon, authenticated;